@@ -40,6 +40,11 @@ class IOEventCallback(Protocol):
         raise NotImplementedError
 
 
+#: Result of `IOSelector.select`: triggered callbacks along with corresponding file
+#: descriptors and events, stored as parallel lists to avoid tuple per triggered callback
+IOSelectResult = tuple[list[IOEventCallback], list[int], list[int]]
+
+
 class IOSelectorRegistry(abc.ABC):
     def add_watch(self, fd: int, events: int, cb: IOEventCallback) -> None:
         raise NotImplementedError
@@ -49,7 +54,7 @@ class IOSelectorRegistry(abc.ABC):
 
 
 class IOSelector(abc.ABC):
-    def select(self, time_: float | None) -> list[tuple[IOEventCallback, int, int]]:
+    def select(self, time_: float | None) -> IOSelectResult:
         raise NotImplementedError
 
     def wakeup_thread_safe(self) -> None:
@@ -61,14 +66,15 @@ class UnhandledExceptionHandler(Protocol):
         raise NotImplementedError
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Handle:
     when: float | None
     callback: CallbackType
     args: tuple[Any, ...] = ()
     executed: bool = False
     cancelled: bool = False
-    context: Mapping[str, Any] = dataclasses.field(default_factory=dict)
+    #: `None` is treated as empty context
+    context: Mapping[str, Any] | None = None
 
     def cancel(self) -> None:
         self.cancelled = True
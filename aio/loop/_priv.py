@@ -1,12 +1,40 @@
 from __future__ import annotations
 
-import contextvars
+import os
 import threading
 from typing import AsyncContextManager
 
 from aio.interfaces import EventLoop, Executor, LoopPolicy, Networking
 
-running_loop: contextvars.ContextVar[EventLoop] = contextvars.ContextVar("running-loop")
+_RunningLoopToken = tuple[EventLoop | None, int | None]
+
+
+class _RunningLoop(threading.local):
+    """
+    Thread-local holder of running loop, mimics `ContextVar` interface.
+
+    Loop stored along with PID of process, which sets it, so forked child process wouldn't
+    observe loop of parent one.
+    """
+
+    loop_pid: _RunningLoopToken = (None, None)
+
+    def get(self) -> EventLoop:
+        loop, pid = self.loop_pid
+        if loop is None or pid != os.getpid():
+            raise LookupError("Running loop is not set")
+        return loop
+
+    def set(self, loop: EventLoop) -> _RunningLoopToken:
+        token = self.loop_pid
+        self.loop_pid = (loop, os.getpid())
+        return token
+
+    def reset(self, token: _RunningLoopToken) -> None:
+        self.loop_pid = token
+
+
+running_loop = _RunningLoop()
 
 
 def get_running_loop() -> EventLoop:
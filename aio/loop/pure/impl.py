@@ -10,6 +10,7 @@ from aio.interfaces import (
     Clock,
     EventLoop,
     Handle,
+    IOEventCallback,
     IOSelector,
     LoopRunner,
     LoopStopped,
@@ -20,11 +21,15 @@ from aio.loop._priv import running_loop
 from aio.loop.pure.clock import MonotonicClock
 from aio.loop.pure.scheduler import Scheduler
 from aio.types import Logger
-from aio.utils import MeasureElapsed, get_logger
+from aio.utils import NULL_MEASURE_ELAPSED, MeasureElapsed, NullMeasureElapsed, get_logger
 
 T = TypeVar("T")
 CPS = ParamSpec("CPS")
 
+# Bound once, since running loop being set and reset on every loop step
+_set_running_loop = running_loop.set
+_reset_running_loop = running_loop.reset
+
 
 def _report_loop_callback_error(
     exc: BaseException,
@@ -35,9 +40,8 @@ def _report_loop_callback_error(
     logger: Logger = get_logger(),
     **context: Any,
 ) -> None:
-    logger = logger.bind(**context)
-    if cb:
-        logger = logger.bind(callback=cb)
+    # Single `bind` call, each of them creates new logger instance
+    logger = logger.bind(callback=cb, **context) if cb else logger.bind(**context)
 
     if not isinstance(exc, Exception):
         logger.warning(
@@ -65,7 +69,18 @@ def _report_loop_callback_error(
         )
 
 
-_LOOP_DEBUG = bool(os.environ.get("AIO_DEBUG", __debug__))
+def _is_debug_enabled(value: str | None) -> bool:
+    return value is not None and value.strip().lower() in ("1", "true", "yes", "on")
+
+
+#: Read once at import time, debug mode is off unless `AIO_DEBUG` explicitly enables it.
+#: Scheduling paths additionally gated by `__debug__`, so their debug logging being
+#: stripped at compile time when running under `python -O`.
+_LOOP_DEBUG = _is_debug_enabled(os.environ.get("AIO_DEBUG"))
+
+#: How many times callbacks scheduled by other callbacks being drained within the same
+#: step in eager mode, before loop proceeds to IO polling
+_EAGER_MAX_ROUNDS = 16
 
 
 class BaseEventLoop(EventLoop):
@@ -78,6 +93,7 @@ class BaseEventLoop(EventLoop):
         exception_handler: UnhandledExceptionHandler | None = None,
         logger: Logger | None = None,
         debug: bool = _LOOP_DEBUG,
+        eager: bool = False,
     ) -> None:
         logger = logger or get_logger()
         self._logger = logger.bind(component="event-loop")
@@ -86,169 +102,207 @@ class BaseEventLoop(EventLoop):
         self._selector = selector
         self._selector_in_poll = False
         self._clock = clock
+        # Clock resolution is constant, also bind `now` once to avoid attribute lookups in
+        # the hot path
+        self._now = clock.now
+        self._resolution = clock.resolution()
         self._exception_handler = exception_handler or partial(
             _report_loop_callback_error, logger=self._logger
         )
 
         self._debug = debug
+        # Buffers for handles popped on each step, reused to avoid list allocation per step
+        self._early_buf: list[Handle] = []
+        self._late_buf: list[Handle] = []
+        # In eager mode callbacks, scheduled via `call_soon` by other callbacks, being invoked
+        # within the same step instead of waiting for the next one
+        self._eager = eager
 
     def run_step(self) -> None:
-        self._logger.trace("Running loop step...")
+        now = self._now
+        clock_resolution = self._resolution
+        scheduler = self._scheduler
+        selector = self._selector
+        trace = self._logger.trace
+        debug = self._debug
+
+        if debug:
+            trace("Running loop step...")
 
-        at_start = self._clock.now()
-        clock_resolution = self._clock.resolution()
-        early_callbacks = self._scheduler.pop_pending(at_start + clock_resolution)
+        at_start = now()
+        early_callbacks = self._early_buf
+        early_callbacks.clear()
+        scheduler.pop_pending_into(at_start + clock_resolution, early_callbacks)
 
         # This logic a bit complicated, but overall idea is simple and acts like
         # `asyncio` do loop step
-        next_event_at: float | None = self._scheduler.next_event()
+        next_event_at: float | None = scheduler.next_event()
         wait_events: float | None
         if len(early_callbacks) > 0:
             wait_events = 0
         elif next_event_at is None:
             wait_events = None
         else:
-            wait_events = next_event_at - self._clock.now()
+            wait_events = next_event_at - now()
             if wait_events < 0:
                 wait_events = 0
 
         #
-        self._logger.trace(
-            "Wait for IO",
-            io_wait_time=(wait_events if wait_events is not None else "wake-on-io"),
+        if debug:
+            trace(
+                "Wait for IO",
+                io_wait_time=(wait_events if wait_events is not None else "wake-on-io"),
+            )
+        # Measurements being done only in debug mode, otherwise it's just a waste of clock reads
+        measure: MeasureElapsed | NullMeasureElapsed = (
+            MeasureElapsed(self._clock) if debug else NULL_MEASURE_ELAPSED
         )
-        with MeasureElapsed(self._clock) as measure_io_wait:
+        with measure:
             try:
                 self._selector_in_poll = True
-                selector_callbacks = self._selector.select(
-                    wait_events,
-                )
+                io_callbacks, io_fds, io_events = selector.select(wait_events)
             finally:
                 self._selector_in_poll = False
 
-            self._logger.trace(
-                "IO waiting completed",
-                triggered_events=len(selector_callbacks),
-                select_poll_elapsed=measure_io_wait.get_elapsed(),
-            )
+            if debug:
+                trace(
+                    "IO waiting completed",
+                    triggered_events=len(io_callbacks),
+                    select_poll_elapsed=measure.get_elapsed(),
+                )
 
         #
-        after_select = self._clock.now()
+        after_select = now()
         end_at = after_select + clock_resolution
 
-        # Apply same nested context for all inner callbacks to make `_get_running_loop`
-        # work
-        cv_context = contextvars.copy_context()
-        measure_callbacks = MeasureElapsed(self._clock)
-
-        # Invoke early callbacks
-        if early_callbacks:
-            self._logger.trace("Invoking early callbacks", callbacks_num=len(early_callbacks))
-            with measure_callbacks:
-                for handle in early_callbacks:
-                    self._invoke_handle(cv_context, handle)
-                self._logger.trace(
-                    "Early callbacks invoked", elapsed=measure_callbacks.get_elapsed()
-                )
-
-        # Invoke IO callbacks
-        self._logger.trace("Invoking IO callbacks", callbacks_num=len(selector_callbacks))
-        with measure_callbacks:
-            for callback, fd, events in selector_callbacks:
-                self._invoke_callback(
-                    cv_context,
-                    callback,
-                    fd,
-                    events,
-                    place="IO-callback",
-                    fd=fd,
-                    events=events,
-                )
-            self._logger.trace("IO callbacks invoked", elapsed=measure_callbacks.get_elapsed())
-
-        # Pop late-callbacks and invoke them
-        late_callbacks = self._scheduler.pop_pending(end_at)
-        self._logger.trace(
-            "Invoking late callbacks",
-            callbacks_num=len(early_callbacks),
-        )
-        with measure_callbacks:
-            for handle in late_callbacks:
-                self._invoke_handle(cv_context, handle)
-            self._logger.trace(
-                "Late callbacks invoked",
-                elapsed=measure_callbacks.get_elapsed(),
+        # Running loop being set once for the whole step, rather than per callback, to make
+        # `get_running_loop` work inside callbacks
+        token = _set_running_loop(self)
+        try:
+            # Same copied context applied for all callbacks of the step, so context variables
+            # changes made by them don't leak outside of the loop
+            contextvars.copy_context().run(
+                self._invoke_step_callbacks,
+                early_callbacks,
+                io_callbacks,
+                io_fds,
+                io_events,
+                end_at,
+                measure,
             )
+        finally:
+            _reset_running_loop(token)
+            # Don't keep invoked handles alive until the next step
+            self._early_buf.clear()
+            self._late_buf.clear()
 
-        self._logger.trace(
-            "Loop step done", total_elapsed=datetime.timedelta(seconds=self._clock.now() - at_start)
-        )
+        if debug:
+            trace("Loop step done", total_elapsed=datetime.timedelta(seconds=now() - at_start))
 
-    def _invoke_callback(
+    def _invoke_step_callbacks(
         self,
-        cv_context: contextvars.Context,
-        callback: Callable[CPS, None],
-        *args: CPS.args,
-        **callback_context: Any,
+        early_callbacks: list[Handle],
+        io_callbacks: list[IOEventCallback],
+        io_fds: list[int],
+        io_events: list[int],
+        end_at: float,
+        measure: MeasureElapsed | NullMeasureElapsed,
     ) -> None:
-        cv_context.run(
-            self._invoke_callback_within_context,
-            callback,
-            *args,
-            **callback_context,
-        )
+        scheduler = self._scheduler
+        exception_handler = self._exception_handler
+        trace = self._logger.trace
+        debug = self._debug
 
-    def _invoke_callback_within_context(
-        self,
-        callback: Callable[CPS, None],
-        *args: CPS.args,
-        **callback_context: Any,
-    ) -> None:
-        token = running_loop.set(self)
-        try:
-            callback(*args)
-        except Exception as err:
-            self._exception_handler(err, cb=callback, **callback_context)
-        except BaseException as err:
-            self._exception_handler(err, cb=callback, **callback_context)
-            raise
-        finally:
-            running_loop.reset(token)
+        # Invoke early callbacks
+        if early_callbacks:
+            if debug:
+                trace("Invoking early callbacks", callbacks_num=len(early_callbacks))
+            with measure:
+                self._invoke_handles(early_callbacks)
+                if debug:
+                    trace("Early callbacks invoked", elapsed=measure.get_elapsed())
 
-    def _invoke_handle(self, cv_context: contextvars.Context, handle: Handle) -> None:
-        if handle.cancelled:
-            self._logger.trace("Skipping cancelled handle", handle=handle)
-            return
+        # Invoke IO callbacks
+        if debug:
+            trace("Invoking IO callbacks", callbacks_num=len(io_callbacks))
+        with measure:
+            for callback, fd, events in zip(io_callbacks, io_fds, io_events):
+                try:
+                    callback(fd, events)
+                except Exception as err:
+                    exception_handler(err, cb=callback, place="IO-callback", fd=fd, events=events)
+                except BaseException as err:
+                    exception_handler(err, cb=callback, place="IO-callback", fd=fd, events=events)
+                    raise
+            if debug:
+                trace("IO callbacks invoked", elapsed=measure.get_elapsed())
 
-        self._invoke_callback(cv_context, handle.callback, *handle.args)
-        # Mark handle as executed after actual execution despite result
-        handle.executed = True
+        # Pop late-callbacks and invoke them
+        late_callbacks = self._late_buf
+        late_callbacks.clear()
+        scheduler.pop_pending_into(end_at, late_callbacks)
+        if debug:
+            trace("Invoking late callbacks", callbacks_num=len(late_callbacks))
+        with measure:
+            self._invoke_handles(late_callbacks)
+            if debug:
+                trace("Late callbacks invoked", elapsed=measure.get_elapsed())
+
+        if self._eager:
+            for _ in range(_EAGER_MAX_ROUNDS):
+                ready_callbacks = scheduler.pop_ready()
+                if not ready_callbacks:
+                    break
+                self._invoke_handles(ready_callbacks)
+
+    def _invoke_handles(self, handles: list[Handle]) -> None:
+        # Whole batch is processed within single frame, so invoking each handle doesn't cost
+        # an extra Python call
+        exception_handler = self._exception_handler
+        debug = self._debug
+        for handle in handles:
+            if handle.cancelled:
+                if debug:
+                    self._logger.trace("Skipping cancelled handle", handle=handle)
+                continue
+
+            callback = handle.callback
+            args = handle.args
+            try:
+                # Most of handles have no arguments, plain call is cheaper than unpacking one
+                if args:
+                    callback(*args)
+                else:
+                    callback()
+            except Exception as err:
+                exception_handler(err, cb=callback)
+            except BaseException as err:
+                exception_handler(err, cb=callback)
+                raise
+            # Mark handle as executed after actual execution despite result
+            handle.executed = True
 
     @property
     def clock(self) -> Clock:
         return self._clock
 
-    def _wakeup_selector_if_in_poll(self) -> None:
-        if not self._selector_in_poll:
-            return
-        self._selector.wakeup_thread_safe()
-
     def call_soon(
         self,
         target: Callable[CPS, None],
         *args: CPS.args,
         context: Mapping[str, Any] | None = None,
     ) -> Handle:
-        if self._debug:
+        if __debug__ and self._debug:
             self._logger.trace(
                 "Enqueuing callback for next cycle",
                 callback=target,
                 callback_args=args,
             )
 
-        handle = Handle(None, target, args, False, False, context or {})
+        handle = Handle(None, target, args, False, False, context)
         self._scheduler.enqueue(handle)
-        self._wakeup_selector_if_in_poll()
+        if self._selector_in_poll:
+            self._selector.wakeup_thread_safe()
         return handle
 
     def call_later(
@@ -261,8 +315,8 @@ class BaseEventLoop(EventLoop):
         if timeout == 0:
             return self.call_soon(target, *args, context=context)
 
-        call_at = self._clock.now() + timeout
-        if self._debug:
+        call_at = self._now() + timeout
+        if __debug__ and self._debug:
             self._logger.trace(
                 "Enqueuing callback at",
                 callback=target,
@@ -270,9 +324,10 @@ class BaseEventLoop(EventLoop):
                 call_at=call_at,
             )
 
-        handle = Handle(call_at, target, args, False, False, context or {})
+        handle = Handle(call_at, target, args, False, False, context)
         self._scheduler.enqueue(handle)
-        self._wakeup_selector_if_in_poll()
+        if self._selector_in_poll:
+            self._selector.wakeup_thread_safe()
         return handle
 
 
@@ -289,8 +344,10 @@ class BaseLoopRunner(LoopRunner[BaseEventLoop]):
             raise RuntimeError("`run_loop` being called twice")
 
         self._run = True
-        while self._run or self._loop._scheduler.items_num():
-            self._loop.run_step()
+        run_step = self._loop.run_step
+        scheduler = self._loop._scheduler
+        while self._run or scheduler.items_num():
+            run_step()
 
         raise LoopStopped
 
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import functools
+import math
+import operator
+import select
 import selectors
 import socket
 from collections import defaultdict
@@ -12,6 +15,7 @@ from aio.interfaces import (
     IOEventCallback,
     IOSelector,
     IOSelectorRegistry,
+    IOSelectResult,
     Networking,
     Promise,
     SocketAddress,
@@ -26,7 +30,7 @@ _SelectorKeyData = set[tuple[int, IOEventCallback]]
 class _SelectorWakeupper:
     def __init__(
         self,
-        selector: STDSelector[_SelectorKeyData],
+        selector: IOSelectorRegistry,
         *,
         logger: Logger | None = None,
     ) -> None:
@@ -39,10 +43,8 @@ class _SelectorWakeupper:
     def _init_self_pipe(self) -> None:
         self._receiver.setblocking(False)
 
-        self._selector.register(
-            self._receiver,
-            selectors.EVENT_READ,
-            {(selectors.EVENT_READ, self._on_receiver_input)},
+        self._selector.add_watch(
+            self._receiver.fileno(), selectors.EVENT_READ, self._on_receiver_input
         )
 
     def wakeup(self) -> None:
@@ -64,7 +66,7 @@ class _SelectorWakeupper:
             pass
 
     def close(self) -> None:
-        self._selector.unregister(self._receiver)
+        self._selector.stop_watch(self._receiver.fileno(), None, None)
         for sock in (self._sender, self._receiver):
             try:
                 sock.close()
@@ -92,19 +94,22 @@ class SelectorsEventsSelector(IOSelectorRegistry, IOSelector):
         self._selector: STDSelector[_SelectorKeyData] = selector or selectors.DefaultSelector()
         self._logger = (logger or get_logger()).bind(component="selectors-event-selector")
 
-        self._wakeupper = _SelectorWakeupper(self._selector, logger=logger)
         self._is_finalized = False
+        self._wakeupper = _SelectorWakeupper(self, logger=logger)
 
-    def select(self, timeout: float | None) -> list[tuple[IOEventCallback, int, int]]:
+    def select(self, timeout: float | None) -> IOSelectResult:
         self._check_not_finalized()
 
-        ready = self._selector.select(timeout)
-        return [
-            (callback, key.fd, events)
-            for key, events in ready
-            for need_events, callback in key.data
-            if events & need_events == need_events
-        ]
+        callbacks: list[IOEventCallback] = []
+        fds: list[int] = []
+        triggered_events: list[int] = []
+        for key, events in self._selector.select(timeout):
+            for need_events, callback in key.data:
+                if events & need_events == need_events:
+                    callbacks.append(callback)
+                    fds.append(key.fd)
+                    triggered_events.append(events)
+        return callbacks, fds, triggered_events
 
     def add_watch(self, fd: int, events: int, cb: IOEventCallback) -> None:
         self._check_not_finalized()
@@ -161,8 +166,8 @@ class SelectorsEventsSelector(IOSelectorRegistry, IOSelector):
         self._wakeupper.wakeup()
 
     def close(self) -> None:
-        self._is_finalized = True
         self._wakeupper.close()
+        self._is_finalized = True
         self._selector.close()
 
     def _check_not_finalized(self) -> None:
@@ -170,6 +175,135 @@ class SelectorsEventsSelector(IOSelectorRegistry, IOSelector):
             raise RuntimeError("Attempt to use selector which has been already finalized")
 
 
+def _to_epoll_mask(events: int) -> int:
+    mask = 0
+    if events & selectors.EVENT_READ:
+        mask |= select.EPOLLIN
+    if events & selectors.EVENT_WRITE:
+        mask |= select.EPOLLOUT
+    return mask
+
+
+def _from_epoll_mask(mask: int) -> int:
+    # Same as `selectors.EpollSelector` do: error and hang-up conditions being reported
+    # as both read and write events, thus waiters will observe them on next IO attempt
+    events = 0
+    if mask & ~select.EPOLLOUT:
+        events |= selectors.EVENT_READ
+    if mask & ~select.EPOLLIN:
+        events |= selectors.EVENT_WRITE
+    return events
+
+
+class EpollEventsSelector(IOSelectorRegistry, IOSelector):
+    """
+    Linux-only selector, which uses `select.epoll` directly, without `selectors` module
+    layer, which wraps every ready file descriptor into `SelectorKey`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_events: int = 1024,
+        logger: Logger | None = None,
+    ) -> None:
+        """
+
+        :param max_events: maximum number of events being fetched by single `epoll.poll`
+        """
+        self._epoll = select.epoll()
+        self._max_events = max_events
+        self._watches: dict[int, _SelectorKeyData] = {}
+        self._logger = (logger or get_logger()).bind(component="epoll-event-selector")
+
+        self._is_finalized = False
+        self._wakeupper = _SelectorWakeupper(self, logger=logger)
+
+    def select(self, timeout: float | None) -> IOSelectResult:
+        self._check_not_finalized()
+
+        if timeout is None:
+            timeout = -1
+        elif timeout > 0:
+            # `epoll_wait` has milliseconds resolution, round timeout up to avoid busy loop
+            timeout = math.ceil(timeout * 1e3) * 1e-3
+
+        callbacks: list[IOEventCallback] = []
+        fds: list[int] = []
+        triggered_events: list[int] = []
+        watches = self._watches
+        for fd, mask in self._epoll.poll(timeout, self._max_events):
+            events = _from_epoll_mask(mask)
+            for need_events, callback in watches.get(fd, ()):
+                if events & need_events == need_events:
+                    callbacks.append(callback)
+                    fds.append(fd)
+                    triggered_events.append(events)
+        return callbacks, fds, triggered_events
+
+    def add_watch(self, fd: int, events: int, cb: IOEventCallback) -> None:
+        self._check_not_finalized()
+
+        watch = self._watches.get(fd)
+        if watch is None:
+            self._epoll.register(fd, _to_epoll_mask(events))
+            self._watches[fd] = {(events, cb)}
+        else:
+            watch.add((events, cb))
+            self._epoll.modify(fd, self._watch_epoll_mask(watch))
+
+    def stop_watch(self, fd: int, events: int | None, cb: IOEventCallback | None) -> None:
+        self._check_not_finalized()
+
+        if (events is None) != (cb is None):
+            raise ValueError("`events` and `cb` args must be both either defined or not")
+
+        watch = self._watches.get(fd)
+        if watch is None:
+            return
+
+        if events is not None:
+            for reg_events, reg_cb in list(watch):
+                if reg_cb != cb:
+                    continue
+                watch.remove((reg_events, reg_cb))
+                new_need_events = reg_events & (~events)
+                if new_need_events != 0:
+                    watch.add((new_need_events, reg_cb))
+
+        if events is None or len(watch) == 0:
+            del self._watches[fd]
+            try:
+                self._epoll.unregister(fd)
+            except OSError:
+                # File descriptor could be already closed
+                pass
+        else:
+            try:
+                self._epoll.modify(fd, self._watch_epoll_mask(watch))
+            except OSError:
+                # File descriptor could be already closed, so its registration is gone as well
+                del self._watches[fd]
+
+    def wakeup_thread_safe(self) -> None:
+        self._check_not_finalized()
+
+        self._wakeupper.wakeup()
+
+    def close(self) -> None:
+        self._wakeupper.close()
+        self._is_finalized = True
+        self._epoll.close()
+
+    @staticmethod
+    def _watch_epoll_mask(watch: _SelectorKeyData) -> int:
+        return _to_epoll_mask(functools.reduce(operator.or_, (e for e, _ in watch)))
+
+    def _check_not_finalized(self) -> None:
+        if self._is_finalized:
+            raise RuntimeError("Attempt to use selector which has been already finalized")
+
+
 class SelectorNetworking(Networking):
     def __init__(
         self,
@@ -321,6 +455,12 @@ def create_selectors_event_selector(
     return closing(SelectorsEventsSelector(logger=logger))
 
 
+def create_epoll_event_selector(
+    logger: Logger | None = None,
+) -> ContextManager[EpollEventsSelector]:
+    return closing(EpollEventsSelector(logger=logger))
+
+
 def create_selector_networking(
     selector: IOSelectorRegistry, logger: Logger | None = None
 ) -> ContextManager[SelectorNetworking]:
@@ -1,12 +1,18 @@
+from __future__ import annotations
+
+import select
+import types
 from contextlib import asynccontextmanager, contextmanager
 from functools import partial
-from typing import Any, AsyncIterator, Callable, ContextManager, Iterator
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, ContextManager, Iterator, Type
 
 from aio.components.executor import concurrent_executor_factory
 from aio.interfaces import Executor, IOSelector, LoopPolicy, LoopRunner, Networking
 from aio.loop.pure.impl import BaseEventLoop, BaseLoopRunner
 from aio.loop.pure.networking import (
+    EpollEventsSelector,
     SelectorsEventsSelector,
+    create_epoll_event_selector,
     create_selector_networking,
     create_selectors_event_selector,
 )
@@ -14,6 +20,42 @@ from aio.types import Logger
 from aio.utils import get_logger
 
 
+class _NetworkingContextManager:
+    """
+    Hand-written instead of `asynccontextmanager` based one, because in most cases
+    networking is already cached and entering it should be cheap.
+    """
+
+    def __init__(self, policy: BaseLoopPolicy) -> None:
+        self._policy = policy
+        self._owned_cm: ContextManager[Networking] | None = None
+
+    async def __aenter__(self) -> Networking:
+        policy = self._policy
+        assert policy._selector
+        if policy._cached_networking:
+            return policy._cached_networking
+
+        self._owned_cm = create_selector_networking(policy._selector)
+        networking = self._owned_cm.__enter__()
+        policy._cached_networking = networking
+        return networking
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> bool | None:
+        if self._owned_cm is None:
+            return None
+
+        owned_cm, self._owned_cm = self._owned_cm, None
+        self._policy._cached_networking = None
+        owned_cm.__exit__(exc_type, exc_val, exc_tb)
+        return None
+
+
 class BaseLoopPolicy(LoopPolicy[BaseEventLoop]):
     def __init__(
         self,
@@ -21,7 +63,7 @@ class BaseLoopPolicy(LoopPolicy[BaseEventLoop]):
     ) -> None:
         self._selector_factory = selector_factory
 
-        self._selector: SelectorsEventsSelector | None = None
+        self._selector: SelectorsEventsSelector | EpollEventsSelector | None = None
         self._loop: BaseEventLoop | None = None
         self._cached_networking: Networking | None = None
         self._cached_executor: Executor | None = None
@@ -29,7 +71,9 @@ class BaseLoopPolicy(LoopPolicy[BaseEventLoop]):
     @contextmanager
     def create_loop(
         self,
-        selector_factory: Callable[[], ContextManager[SelectorsEventsSelector]] | None = None,
+        selector_factory: (
+            Callable[[], ContextManager[SelectorsEventsSelector | EpollEventsSelector]] | None
+        ) = None,
         logger: Logger | None = None,
         **loop_kwargs: Any,
     ) -> Iterator[BaseEventLoop]:
@@ -40,7 +84,11 @@ class BaseLoopPolicy(LoopPolicy[BaseEventLoop]):
 
         selector_factory = selector_factory or self._selector_factory
         if not selector_factory:
-            selector_factory = partial(create_selectors_event_selector, logger=logger)
+            # Prefer direct `epoll` usage where it is available
+            if hasattr(select, "epoll"):
+                selector_factory = partial(create_epoll_event_selector, logger=logger)
+            else:
+                selector_factory = partial(create_selectors_event_selector, logger=logger)
 
         with selector_factory() as selector:
             self._selector = selector
@@ -50,18 +98,8 @@ class BaseLoopPolicy(LoopPolicy[BaseEventLoop]):
     def create_loop_runner(self, loop: BaseEventLoop) -> LoopRunner[BaseEventLoop]:
         return BaseLoopRunner(loop)
 
-    @asynccontextmanager
-    async def create_networking(self) -> AsyncIterator[Networking]:
-        assert self._selector
-        if self._cached_networking:
-            yield self._cached_networking
-        else:
-            with create_selector_networking(self._selector) as networking:
-                self._cached_networking = networking
-                try:
-                    yield networking
-                finally:
-                    self._cached_networking = None
+    def create_networking(self) -> AsyncContextManager[Networking]:
+        return _NetworkingContextManager(self)
 
     @asynccontextmanager
     async def create_executor(self) -> AsyncIterator[Executor]:
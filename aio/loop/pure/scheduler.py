@@ -1,105 +1,95 @@
 import heapq
 import itertools
 from collections import deque
-from typing import Callable, Generic, Iterable, Protocol, TypeVar
+from typing import Iterable
 
 from aio.interfaces import Handle
 
-T = TypeVar("T")
 
+class Scheduler:
+    """
+    Holds handles waiting for execution: pending ones (without `when`) are kept in FIFO
+    queue, while ones scheduled at some time are kept in heap ordered by `when`.
+    """
 
-class HasLowerEq(Protocol):
-    def __le__(self: T, other: T) -> bool | NotImplementedError:
-        raise NotImplementedError
-
-
-P = TypeVar("P", bound=HasLowerEq)
-
-
-class MinPriority:
-    pass
-
-
-MIN_PRIORITY_SENTINEL = MinPriority()
-
-
-class PriorityQueue(Generic[T, P]):
-    def __init__(
-        self,
-        priority_fn: Callable[[T], P | MinPriority],
-        _min_priority: Iterable[T] = (),
-        _prioritized: Iterable[T] = (),
-    ) -> None:
-        self._priority_fn = priority_fn
-        self._ids_generator = iter(itertools.count())
-        self._min_priority: deque[T] = deque(_min_priority)
-        self._prioritized = [self._wrap_item(item) for item in _prioritized]
-        heapq.heapify(self._prioritized)
-
-    def _wrap_item(self, item: T) -> tuple[P, int, T]:
-        priority = self._priority_fn(item)
-        if priority is MIN_PRIORITY_SENTINEL:
-            raise ValueError(
-                "Could not wrap item for priority queue due to it is have maximum priority"
-            )
-        assert not isinstance(priority, MinPriority)
-        return priority, next(self._ids_generator), item
-
-    def enqueue(self, item: T) -> None:
-        priority = self._priority_fn(item)
-        if priority is MIN_PRIORITY_SENTINEL:
-            self._min_priority.append(item)
-        else:
-            heapq.heappush(self._prioritized, self._wrap_item(item))
-
-    def pop_below_priority(self, threshold: P) -> list[T]:
-        old_max_priority, self._min_priority = self._min_priority, deque()
-        return list(old_max_priority) + self._pop_prioritized_low(threshold)
-
-    def get_items(self) -> list[T]:
-        return list(self._min_priority) + [item for _, _, item in self._prioritized]
-
-    def _pop_prioritized_low(self, threshold: P) -> list[T]:
-        new_ready: list[T] = []
-        while self._prioritized:
-            priority, _, item = self._prioritized[0]
-            if priority <= threshold:
-                new_ready.append(item)
-                heapq.heappop(self._prioritized)
-            else:
-                break
-        return new_ready
-
-
-def _handle_priority_getter(handle: Handle) -> float | MinPriority:
-    if handle.when is None:
-        return MIN_PRIORITY_SENTINEL
-    return handle.when
-
-
-class Scheduler(PriorityQueue[Handle, float]):
     def __init__(self, pending: Iterable[Handle] = (), enqueued: Iterable[Handle] = ()) -> None:
-        if any(handle.when is not None for handle in pending):
-            raise ValueError(
-                "Scheduler receives pending handles and "
-                "some of them have `when` attr which is not None"
-            )
-        super().__init__(_handle_priority_getter, pending, enqueued)
+        self._next_id = itertools.count().__next__
+        self._pending: deque[Handle] = deque()
+        self._enqueued: list[tuple[float, int, Handle]] = []
+
+        for handle in pending:
+            if handle.when is not None:
+                raise ValueError(
+                    "Scheduler receives pending handles and "
+                    "some of them have `when` attr which is not None"
+                )
+            self._pending.append(handle)
+        for handle in enqueued:
+            if handle.when is None:
+                raise ValueError(
+                    "Scheduler receives enqueued handles and "
+                    "some of them have `when` attr which is None"
+                )
+            self._enqueued.append((handle.when, self._next_id(), handle))
+        heapq.heapify(self._enqueued)
+
+    def enqueue(self, handle: Handle) -> None:
+        when = handle.when
+        if when is None:
+            self._pending.append(handle)
+        else:
+            heapq.heappush(self._enqueued, (when, self._next_id(), handle))
 
     def pop_pending(self, time_threshold: float) -> list[Handle]:
-        return [
-            handle for handle in self.pop_below_priority(time_threshold) if not handle.cancelled
-        ]
+        pending: list[Handle] = []
+        self.pop_pending_into(time_threshold, pending)
+        return pending
+
+    def pop_pending_into(self, time_threshold: float, out: list[Handle]) -> None:
+        self._drain_pending_into(out)
+
+        append = out.append
+        enqueued = self._enqueued
+        heappop = heapq.heappop
+        while enqueued and enqueued[0][0] <= time_threshold:
+            handle = heappop(enqueued)[2]
+            if not handle.cancelled:
+                append(handle)
+
+    def pop_ready(self) -> list[Handle]:
+        ready: list[Handle] = []
+        self._drain_pending_into(ready)
+        return ready
+
+    def _drain_pending_into(self, out: list[Handle]) -> None:
+        # `call_soon_thread_safe` appends to pending queue from other threads, so queue is
+        # swapped out first instead of being iterated and cleared in place: otherwise deque
+        # could be mutated during iteration, or handle appended before `clear` got lost.
+        # Swapped out queue drained with `popleft`, so late append into it is also safe.
+        pending, self._pending = self._pending, deque()
+        append = out.append
+        popleft = pending.popleft
+        while pending:
+            handle = popleft()
+            if not handle.cancelled:
+                append(handle)
+
+    def get_items(self) -> list[Handle]:
+        return list(self._pending) + [handle for _, _, handle in self._enqueued]
 
     def items_num(self) -> int:
-        return sum(1 for handle in self._min_priority if not handle.cancelled) + sum(
-            1 for _, _, handle in self._prioritized if not handle.cancelled
+        return sum(1 for handle in self._pending if not handle.cancelled) + sum(
+            1 for _, _, handle in self._enqueued if not handle.cancelled
         )
 
     def next_event(self) -> float | None:
-        for _, _, handle in self._prioritized:
-            assert handle.when is not None
+        # Heap is ordered only by its top, so drop cancelled handles from the top until
+        # actual nearest one is found, instead of scanning underlying list in storage order
+        enqueued = self._enqueued
+        while enqueued:
+            _, _, handle = enqueued[0]
             if not handle.cancelled:
                 return handle.when
+            heapq.heappop(enqueued)
 
         return None
@@ -122,6 +122,33 @@ class MeasureElapsed:
         return None
 
 
+class NullMeasureElapsed:
+    """
+    No-op counterpart of `MeasureElapsed`, intended to be used instead of it when
+    measurements are disabled.
+    """
+
+    def get_elapsed(self) -> datetime.timedelta:
+        return datetime.timedelta()
+
+    def get_elapsed_sec(self) -> float:
+        return 0.0
+
+    def __enter__(self) -> NullMeasureElapsed:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> bool | None:
+        return None
+
+
+NULL_MEASURE_ELAPSED = NullMeasureElapsed()
+
+
 def is_coro_running(coro: Coroutine[Any, Any, Any]) -> bool:
     return inspect.getcoroutinestate(coro) in {inspect.CORO_RUNNING, inspect.CORO_SUSPENDED}
 
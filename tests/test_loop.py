@@ -1,7 +1,9 @@
 import contextlib
+import contextvars
 import gc
 import os
 import signal
+import threading
 from unittest.mock import DEFAULT, MagicMock, Mock, call, patch
 
 import pytest
@@ -38,9 +40,9 @@ def selector(clock):
 
     def selector_select(time_):
         if time_ is None:
-            return []
+            return [], [], []
         clock.now.return_value += time_
-        return []
+        return [], [], []
 
     selector.select = Mock(wraps=selector_select)
     return selector
@@ -65,12 +67,11 @@ def loop_policy(selector, clock):
 class TestLoopStepping:
     @pytest.fixture
     def make_loop(self, selector, clock):
-        return lambda scheduler: BaseEventLoop(
-            selector,
-            clock=clock,
-            scheduler=scheduler,
-            exception_handler=process_callback_exception,
-        )
+        def make_loop(scheduler, **loop_kwargs):
+            loop_kwargs.setdefault("exception_handler", process_callback_exception)
+            return BaseEventLoop(selector, clock=clock, scheduler=scheduler, **loop_kwargs)
+
+        return make_loop
 
     def test_runs_io_callbacks(self, selector, make_loop):
         # TODO
@@ -360,7 +361,7 @@ class TestLoopStepping:
         def io_callback(*_):
             assert aio.loop._priv.running_loop.get() is loop
 
-        selector.select = lambda *_: [(io_callback, 0, 0)]
+        selector.select = lambda *_: ([io_callback], [0], [0])
 
         loop = make_loop(Scheduler())
         loop.run_step()
@@ -370,6 +371,172 @@ class TestLoopStepping:
         with pytest.raises(LookupError):
             aio.loop._priv.running_loop.get()
 
+    def test_callbacks_context_vars_changes_dont_leak_out_of_step(self, make_loop):
+        cv = contextvars.ContextVar("test-cv")
+        token = cv.set("outer")
+
+        @mock_wraps
+        def set_cv():
+            cv.set("leaked")
+
+        @mock_wraps
+        def get_cv():
+            assert cv.get() == "leaked"
+
+        try:
+            make_loop(Scheduler([Handle(None, set_cv), Handle(None, get_cv)])).run_step()
+            assert cv.get() == "outer"
+        finally:
+            cv.reset(token)
+
+        assert set_cv.mock_calls == [call()]
+        assert get_cv.mock_calls == [call()]
+
+    def test_running_loop_not_visible_from_other_thread(self, make_loop):
+        seen_in_thread = []
+
+        def look_up_running_loop():
+            try:
+                seen_in_thread.append(aio.loop._priv.running_loop.get())
+            except LookupError:
+                seen_in_thread.append(None)
+
+        @mock_wraps
+        def handle_cb():
+            assert aio.loop._priv.running_loop.get() is loop
+            thread = threading.Thread(target=look_up_running_loop)
+            thread.start()
+            thread.join()
+
+        loop = make_loop(Scheduler([Handle(None, handle_cb)]))
+        loop.run_step()
+
+        assert handle_cb.mock_calls == [call()]
+        assert seen_in_thread == [None]
+
+    def test_resets_running_loop_cv_if_callback_raises_base_exception(self, make_loop):
+        class _Interrupt(BaseException):
+            pass
+
+        def handle_cb():
+            raise _Interrupt
+
+        exception_handler = Mock()
+        loop = make_loop(Scheduler([Handle(None, handle_cb)]), exception_handler=exception_handler)
+
+        with pytest.raises(_Interrupt):
+            loop.run_step()
+
+        assert len(exception_handler.mock_calls) == 1
+        with pytest.raises(LookupError):
+            aio.loop._priv.running_loop.get()
+
+    @pytest.mark.parametrize("debug", [True, False])
+    def test_measures_elapsed_only_in_debug_mode(self, make_loop, debug):
+        cb = Mock()
+        loop = make_loop(Scheduler([Handle(None, cb)]), debug=debug)
+
+        with patch("aio.loop.pure.impl.MeasureElapsed") as measure_elapsed_cls:
+            loop.run_step()
+
+        assert cb.mock_calls == [call()]
+        assert measure_elapsed_cls.called is debug
+
+    @pytest.mark.parametrize("debug", [True, False])
+    def test_traces_skipped_cancelled_handle_only_in_debug_mode(self, make_loop, debug):
+        logger = Mock(name="logger")
+        handle = Handle(None, Mock())
+        loop = make_loop(Scheduler(), logger=logger, debug=debug)
+
+        loop._invoke_handles([handle])
+        handle.cancel()
+        loop._invoke_handles([handle])
+
+        assert handle.callback.mock_calls == [call()]
+        trace_calls = logger.bind.return_value.trace.mock_calls
+        assert (call("Skipping cancelled handle", handle=handle) in trace_calls) is debug
+
+    def test_doesnt_measure_nor_trace_step_by_default(self, make_loop):
+        logger = Mock(name="logger")
+        loop = make_loop(Scheduler([Handle(None, Mock())]), logger=logger)
+
+        with patch("aio.loop.pure.impl.MeasureElapsed") as measure_elapsed_cls:
+            loop.run_step()
+
+        assert not measure_elapsed_cls.called
+        assert logger.bind.return_value.trace.mock_calls == []
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (None, False),
+            ("", False),
+            ("0", False),
+            ("false", False),
+            ("off", False),
+            ("1", True),
+            ("true", True),
+            ("Yes", True),
+            (" on ", True),
+        ],
+    )
+    def test_parses_debug_env_value(self, value, expected):
+        assert aio.loop.pure.impl._is_debug_enabled(value) is expected
+
+    def test_doesnt_trace_step_if_not_debug(self, make_loop):
+        logger = Mock(name="logger")
+        loop = make_loop(Scheduler([Handle(None, Mock())]), logger=logger, debug=False)
+
+        loop.run_step()
+
+        assert logger.bind.return_value.trace.mock_calls == []
+
+    @pytest.mark.parametrize("eager", [True, False])
+    def test_runs_chained_callbacks_within_same_step_if_eager(self, selector, make_loop, eager):
+        chained_cb = Mock(name="chained-cb")
+
+        def first_cb():
+            # Callbacks scheduled by early callbacks always invoked as late ones
+            loop.call_soon(late_cb)
+
+        def late_cb():
+            loop.call_soon(chained_cb)
+
+        loop = make_loop(Scheduler([Handle(None, first_cb)]), eager=eager)
+        loop.run_step()
+
+        assert chained_cb.mock_calls == ([call()] if eager else [])
+        assert selector.mock_calls == [call.select(0)]
+
+    def test_eager_mode_limits_rounds_per_step(self, make_loop):
+        @mock_wraps
+        def reschedule_self():
+            loop.call_soon(reschedule_self)
+
+        loop = make_loop(Scheduler([Handle(None, reschedule_self)]), eager=True)
+        loop.run_step()
+
+        # Early and late invocation, and then eager rounds
+        assert len(reschedule_self.mock_calls) == 2 + aio.loop.pure.impl._EAGER_MAX_ROUNDS
+        assert len(loop._scheduler.get_items()) == 1
+
+
+class TestRunningLoop:
+    def test_not_visible_in_forked_process(self):
+        loop = Mock(name="loop")
+        token = aio.loop._priv.running_loop.set(loop)
+        try:
+            assert aio.loop._priv.running_loop.get() is loop
+
+            with patch("aio.loop._priv.os.getpid", return_value=os.getpid() + 1):
+                with pytest.raises(LookupError):
+                    aio.loop._priv.running_loop.get()
+        finally:
+            aio.loop._priv.running_loop.reset(token)
+
+        with pytest.raises(LookupError):
+            aio.loop._priv.running_loop.get()
+
 
 class TestLoopRunner:
     @pytest.fixture
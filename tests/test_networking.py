@@ -0,0 +1,84 @@
+import select
+import selectors
+import socket
+from unittest.mock import Mock
+
+import pytest
+
+from aio.loop.pure.networking import EpollEventsSelector
+
+
+@pytest.mark.skipif(not hasattr(select, "epoll"), reason="`epoll` isn't available")
+class TestEpollEventsSelector:
+    @pytest.fixture
+    def selector(self):
+        selector = EpollEventsSelector()
+        try:
+            yield selector
+        finally:
+            selector.close()
+
+    @pytest.fixture
+    def socket_pair(self):
+        left, right = socket.socketpair()
+        left.setblocking(False)
+        right.setblocking(False)
+        with left, right:
+            yield left, right
+
+    def test_select_returns_triggered_callbacks(self, selector, socket_pair):
+        left, right = socket_pair
+        read_cb = Mock(name="read-cb")
+        write_cb = Mock(name="write-cb")
+        selector.add_watch(left.fileno(), selectors.EVENT_READ, read_cb)
+        selector.add_watch(left.fileno(), selectors.EVENT_WRITE, write_cb)
+
+        assert selector.select(0) == (
+            [write_cb],
+            [left.fileno()],
+            [selectors.EVENT_WRITE],
+        )
+
+        right.send(b"1")
+        callbacks, fds, events = selector.select(0)
+        assert sorted(callbacks, key=id) == sorted([read_cb, write_cb], key=id)
+        assert fds == [left.fileno()] * 2
+        assert events == [selectors.EVENT_READ | selectors.EVENT_WRITE] * 2
+
+    def test_stop_watch_removes_callback(self, selector, socket_pair):
+        left, right = socket_pair
+        read_cb = Mock(name="read-cb")
+        write_cb = Mock(name="write-cb")
+        selector.add_watch(left.fileno(), selectors.EVENT_READ, read_cb)
+        selector.add_watch(left.fileno(), selectors.EVENT_WRITE, write_cb)
+        right.send(b"1")
+
+        selector.stop_watch(left.fileno(), selectors.EVENT_WRITE, write_cb)
+        assert selector.select(0) == ([read_cb], [left.fileno()], [selectors.EVENT_READ])
+
+        selector.stop_watch(left.fileno(), None, None)
+        assert selector.select(0) == ([], [], [])
+
+    def test_stop_watch_after_socket_closed(self, selector):
+        left, right = socket.socketpair()
+        fd = left.fileno()
+        read_cb = Mock(name="read-cb")
+        write_cb = Mock(name="write-cb")
+        selector.add_watch(fd, selectors.EVENT_READ, read_cb)
+        selector.add_watch(fd, selectors.EVENT_WRITE, write_cb)
+        left.close()
+        right.close()
+
+        selector.stop_watch(fd, selectors.EVENT_READ, read_cb)
+        selector.stop_watch(fd, selectors.EVENT_WRITE, write_cb)
+
+        assert selector.select(0) == ([], [], [])
+
+    def test_wakeup_interrupts_select(self, selector):
+        selector.wakeup_thread_safe()
+
+        callbacks, _, _ = selector.select(None)
+        for callback in callbacks:
+            callback(0, 0)
+
+        assert selector.select(0) == ([], [], [])
@@ -0,0 +1,64 @@
+import contextlib
+from unittest.mock import Mock, call, patch
+
+import pytest
+
+from aio.loop.pure.policy import BaseLoopPolicy
+
+
+def run_coro(coro):
+    with pytest.raises(StopIteration) as exc_info:
+        coro.send(None)
+    return exc_info.value.value
+
+
+class TestCreateNetworking:
+    @pytest.fixture
+    def policy(self):
+        policy = BaseLoopPolicy(selector_factory=lambda: contextlib.nullcontext(Mock()))
+        with policy.create_loop():
+            yield policy
+
+    @pytest.fixture
+    def networking(self):
+        networking = Mock(name="networking")
+        with patch(
+            "aio.loop.pure.policy.create_selector_networking",
+            lambda *_, **__: contextlib.closing(networking),
+        ):
+            yield networking
+
+    def test_nested_entry_returns_same_networking(self, policy, networking):
+        async def use_networking():
+            async with policy.create_networking() as outer:
+                async with policy.create_networking() as inner:
+                    return outer, inner
+
+        outer, inner = run_coro(use_networking())
+
+        assert outer is networking
+        assert inner is networking
+
+    def test_only_outermost_entry_closes_networking(self, policy, networking):
+        async def use_networking():
+            async with policy.create_networking():
+                async with policy.create_networking():
+                    pass
+                assert networking.mock_calls == []
+                assert policy._cached_networking is networking
+
+        run_coro(use_networking())
+
+        assert networking.mock_calls == [call.close()]
+        assert policy._cached_networking is None
+
+    def test_closes_networking_on_exception(self, policy, networking):
+        async def use_networking():
+            async with policy.create_networking():
+                raise RuntimeError("Some error")
+
+        with pytest.raises(RuntimeError, match="Some error"):
+            use_networking().send(None)
+
+        assert networking.mock_calls == [call.close()]
+        assert policy._cached_networking is None
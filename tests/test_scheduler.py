@@ -1 +1,93 @@
-# TODO
+import threading
+from unittest.mock import Mock
+
+from aio.interfaces import Handle
+from aio.loop.pure.scheduler import Scheduler
+
+
+class TestScheduler:
+    def test_next_event_skips_cancelled_handles(self):
+        cancelled = Handle(10.0, Mock(), cancelled=True)
+        later = Handle(30.0, Mock())
+        nearest = Handle(20.0, Mock())
+        scheduler = Scheduler([], [cancelled, later, nearest])
+
+        assert scheduler.next_event() == 20.0
+        assert scheduler.get_items() == [nearest, later]
+
+    def test_next_event_none_if_all_cancelled(self):
+        scheduler = Scheduler([], [Handle(10.0, Mock(), cancelled=True)])
+
+        assert scheduler.next_event() is None
+        assert scheduler.get_items() == []
+
+    def test_pop_pending_into_appends_non_cancelled_handles(self):
+        pending = Handle(None, Mock())
+        cancelled_pending = Handle(None, Mock(), cancelled=True)
+        expired = Handle(10.0, Mock())
+        cancelled_expired = Handle(15.0, Mock(), cancelled=True)
+        not_expired = Handle(30.0, Mock())
+        scheduler = Scheduler(
+            [pending, cancelled_pending], [expired, cancelled_expired, not_expired]
+        )
+        existing = Handle(None, Mock())
+        out = [existing]
+
+        scheduler.pop_pending_into(20.0, out)
+
+        assert out == [existing, pending, expired]
+        assert scheduler.get_items() == [not_expired]
+
+    def test_enqueue_keeps_ready_handles_in_fifo_order(self):
+        ready = [Handle(None, Mock()) for _ in range(3)]
+        later = Handle(10.0, Mock())
+        sooner = Handle(5.0, Mock())
+        scheduler = Scheduler()
+
+        scheduler.enqueue(later)
+        for handle in ready:
+            scheduler.enqueue(handle)
+        scheduler.enqueue(sooner)
+
+        assert scheduler.next_event() == 5.0
+        assert scheduler.pop_pending(7.0) == ready + [sooner]
+
+    def test_pop_pending_while_enqueuing_from_other_thread(self):
+        scheduler = Scheduler()
+        late = Handle(None, Mock())
+
+        first = _enqueue_from_other_thread_on_check(scheduler, late)
+        scheduler.enqueue(first)
+
+        assert scheduler.pop_pending(0.0) == [first]
+        assert scheduler.pop_pending(0.0) == [late]
+        assert scheduler.get_items() == []
+
+    def test_pop_ready_while_enqueuing_from_other_thread(self):
+        scheduler = Scheduler()
+        late = Handle(None, Mock())
+
+        first = _enqueue_from_other_thread_on_check(scheduler, late)
+        scheduler.enqueue(first)
+
+        assert scheduler.pop_ready() == [first]
+        assert scheduler.pop_ready() == [late]
+        assert scheduler.get_items() == []
+
+
+def _enqueue_from_other_thread_on_check(scheduler, late):
+    # Deterministically emulates other thread, which calls `call_soon_thread_safe`
+    # exactly while scheduler drains pending handles
+    class EnqueueOnCheck(Handle):
+        @property
+        def cancelled(self):
+            thread = threading.Thread(target=scheduler.enqueue, args=(late,))
+            thread.start()
+            thread.join()
+            return False
+
+        @cancelled.setter
+        def cancelled(self, _):
+            pass
+
+    return EnqueueOnCheck(None, Mock())